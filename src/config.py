@@ -1,11 +1,11 @@
 """Configuration management for the pipeline."""
-import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
+from urllib.parse import quote
 from pydantic import BaseModel, Field
-from dotenv import load_dotenv
 
-load_dotenv()
+from src import envs
 
 # Project paths
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -14,31 +14,37 @@ RAW_DIR = DATA_DIR / "raw"
 STAGING_DIR = DATA_DIR / "staging"
 REJECTED_DIR = DATA_DIR / "rejected"
 
-# Ensure directories exist
-for dir_path in [RAW_DIR, STAGING_DIR, REJECTED_DIR]:
-    dir_path.mkdir(parents=True, exist_ok=True)
+_dirs_ensured = False
 
 
-# Helper function for safe integer parsing
-def _get_env_int(key: str, default: int) -> int:
-    """Safely parse integer from environment variable."""
-    try:
-        return int(os.getenv(key, str(default)))
-    except ValueError:
-        return default
+def ensure_dirs() -> None:
+    """
+    Create the data directories if missing.
+    
+    Called from pipeline entry points rather than on import. Only the
+    first call touches the filesystem; later calls are no-ops.
+    """
+    global _dirs_ensured
+    if _dirs_ensured:
+        return
+    for dir_path in (RAW_DIR, STAGING_DIR, REJECTED_DIR):
+        dir_path.mkdir(parents=True, exist_ok=True)
+    _dirs_ensured = True
 
 
 class DatabaseConfig(BaseModel):
     """Database connection configuration."""
-    host: str = Field(default_factory=lambda: os.getenv("POSTGRES_HOST", "localhost"))
-    port: int = Field(default_factory=lambda: _get_env_int("POSTGRES_PORT", 5432))
-    user: str = Field(default_factory=lambda: os.getenv("POSTGRES_USER", "dataeng"))
-    password: str = Field(default_factory=lambda: os.getenv("POSTGRES_PASSWORD", ""))
-    database: str = Field(default_factory=lambda: os.getenv("POSTGRES_DB", "taxi_analytics"))
+    host: str = Field(default_factory=lambda: envs.POSTGRES_HOST)
+    port: int = Field(default_factory=lambda: envs.POSTGRES_PORT)
+    user: str = Field(default_factory=lambda: envs.POSTGRES_USER)
+    password: str = Field(default_factory=lambda: envs.POSTGRES_PASSWORD)
+    database: str = Field(default_factory=lambda: envs.POSTGRES_DB)
     
     @property
     def connection_string(self) -> str:
-        return f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}"
+        # Quote credentials so reserved characters don't break the URI
+        user, password = quote(self.user, safe=""), quote(self.password, safe="")
+        return f"postgresql://{user}:{password}@{self.host}:{self.port}/{self.database}"
 
 
 class PipelineConfig(BaseModel):
@@ -48,6 +54,13 @@ class PipelineConfig(BaseModel):
     enable_profiling: bool = True
     
 
-# Global config instances
-db_config = DatabaseConfig()
-pipeline_config = PipelineConfig()
+@lru_cache(maxsize=1)
+def get_db_config() -> DatabaseConfig:
+    """Return the process-wide database config, built from env on first call."""
+    return DatabaseConfig()
+
+
+@lru_cache(maxsize=1)
+def get_pipeline_config() -> PipelineConfig:
+    """Return the process-wide pipeline config, built on first call."""
+    return PipelineConfig()
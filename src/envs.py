@@ -0,0 +1,64 @@
+"""Environment variables used by the pipeline.
+
+Every env var the pipeline reads is declared here, so this module is the
+single place to audit them. Values are resolved lazily on first attribute
+access and cached on the module afterwards.
+
+Example:
+    >>> from src import envs
+    >>> envs.POSTGRES_PORT
+    5432
+"""
+import os
+from typing import Any, Callable
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+def _get_int(key: str, default: int) -> int:
+    """Safely parse integer from environment variable."""
+    try:
+        return int(os.getenv(key, str(default)))
+    except ValueError:
+        return default
+
+
+def _get_float(key: str, default: float) -> float:
+    """Safely parse float from environment variable."""
+    try:
+        return float(os.getenv(key, str(default)))
+    except ValueError:
+        return default
+
+
+environment_variables: dict[str, Callable[[], Any]] = {
+    # Database connection
+    "POSTGRES_HOST": lambda: os.getenv("POSTGRES_HOST", "localhost"),
+    "POSTGRES_PORT": lambda: _get_int("POSTGRES_PORT", 5432),
+    "POSTGRES_USER": lambda: os.getenv("POSTGRES_USER", "dataeng"),
+    "POSTGRES_PASSWORD": lambda: os.getenv("POSTGRES_PASSWORD", ""),
+    "POSTGRES_DB": lambda: os.getenv("POSTGRES_DB", "taxi_analytics"),
+    # Max connections held by the shared pool
+    "POSTGRES_POOL_MAX": lambda: _get_int("POSTGRES_POOL_MAX", 10),
+    # Seconds to wait for a pooled connection before failing
+    "POSTGRES_POOL_TIMEOUT": lambda: _get_float("POSTGRES_POOL_TIMEOUT", 5.0),
+    # Year src.main processes when none is given on the command line
+    "PIPELINE_YEAR": lambda: _get_int("PIPELINE_YEAR", 2024),
+    # Overrides the levels in config/logging.yaml when set
+    "LOG_LEVEL": lambda: os.getenv("LOG_LEVEL"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve an environment variable on first access and cache it."""
+    if name in environment_variables:
+        value = environment_variables[name]()
+        # Later lookups find the module attribute and skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return list(environment_variables.keys())
@@ -1,41 +1,170 @@
-"""Simple downloader - no logging, minimal error handling."""
+"""
+Download NYC TLC yellow taxi parquet files.
+
+Months are fetched concurrently over one async HTTP/2 client and
+streamed to disk with aiofiles. Each file is written to '<name>.part'
+and renamed into place once complete, so a file under its final name
+is always a finished download; files already present are skipped.
+"""
+import argparse
+import asyncio
+import os
 from pathlib import Path
-import requests
+import aiofiles
+import httpx
 
+from src.config import RAW_DIR, ensure_dirs
 
-def download_taxi_data_simple(year: int, month: int, output_dir: Path) -> Path:
-    """
-    Download NYC Taxi data - simple version.
-    
-    This is the "I'd write this from scratch" version.
-    No logging, basic error handling, works but not production-ready.
-    """
+BASE_URL = "https://d37ci6vzurychx.cloudfront.net/trip-data"
+CHUNK_SIZE = 1024 * 1024
+
+
+def _build_target(year: int, month: int, output_dir: Path) -> tuple[str, Path]:
+    """Validate a (year, month) pair and return its source URL and output path."""
     # Validate inputs
     if not 1 <= month <= 12:
         raise ValueError(f"Month must be 1-12, got {month}")
-    
+
     # Build URL and path
     filename = f"yellow_tripdata_{year}-{month:02d}.parquet"
-    output_path = output_dir / filename
-    url = f"https://d37ci6vzurychx.cloudfront.net/trip-data/{filename}"
-    
-    # Skip if exists
-    if output_path.exists():
-        print(f"File exists, skipping: {output_path}")
-        return output_path
-    
-    # Create directory
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Download
-    response = requests.get(url, timeout=60)
-    
-    if response.status_code != 200:
-        raise Exception(f"Download failed: HTTP {response.status_code}")
-    
-    # Write file
-    with open(output_path, 'wb') as f:
-        f.write(response.content)
-    
+    return f"{BASE_URL}/{filename}", output_dir / filename
+
+
+def _existing_files(dirp: Path) -> set[str]:
+    """Names of the entries in dirp, or an empty set if it doesn't exist."""
+    try:
+        with os.scandir(dirp) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+async def _download_one(client: httpx.AsyncClient, url: str, output_path: Path) -> Path:
+    """
+    Stream one file to disk in CHUNK_SIZE pieces.
+
+    Bytes go to '<name>.part', which is renamed onto the final name only
+    once the download completes, so only finished files ever carry it.
+    """
+    # Claim the partial file atomically so two runs never write the same one
+    part_path = output_path.with_name(output_path.name + ".part")
+    try:
+        fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+    except FileExistsError:
+        raise Exception(
+            f"Partial download exists: {part_path} (another run is downloading it, "
+            "or a killed run left it behind; delete it to retry)"
+        ) from None
+
+    # Download, streaming to disk; remove the partial file on failure
+    try:
+        # A concurrent run may have finished this file since the batch listing
+        if output_path.exists():
+            os.close(fd)
+            part_path.unlink()
+            print(f"File exists, skipping: {output_path}")
+            return output_path
+
+        # Match the file buffer to the chunk size: one write() per MiB
+        async with aiofiles.open(fd, 'wb', buffering=CHUNK_SIZE) as f:
+            async with client.stream("GET", url) as response:
+                if response.status_code != 200:
+                    raise Exception(f"Download failed: HTTP {response.status_code}")
+
+                async for chunk in response.aiter_bytes(CHUNK_SIZE):
+                    await f.write(chunk)
+
+        os.replace(part_path, output_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+
     print(f"Downloaded: {output_path}")
-    return output_path
\ No newline at end of file
+    return output_path
+
+
+async def download_many(
+    months: list[tuple[int, int]], output_dir: Path, concurrency: int = 8
+) -> list[Path]:
+    """
+    Download several months of NYC Taxi data concurrently.
+
+    Downloads share one HTTP/2 client and at most `concurrency` run at once,
+    so per-file connection setup and slow-start overlap instead of adding up.
+    If any download fails the others are cancelled and its error is raised,
+    with the ExceptionGroup of all failures as its __cause__.
+
+    Args:
+        months: (year, month) pairs to download
+        output_dir: Directory to write parquet files to
+        concurrency: Maximum number of simultaneous downloads
+
+    Returns:
+        Output paths, in the same order as `months` (repeated months are
+        downloaded once but keep their place in the list)
+
+    Example:
+        >>> asyncio.run(download_many([(2024, 1), (2024, 2)], RAW_DIR))
+    """
+    # Validate every month before opening any connection
+    targets = [_build_target(year, month, output_dir) for year, month in months]
+
+    # One directory listing covers the whole batch; only finished files
+    # have the final name, partial downloads end in '.part'
+    existing = _existing_files(output_dir)
+    pending = []
+    # Repeated months share one download; two would race for the .part file
+    for url, output_path in sorted(set(targets)):
+        if output_path.name in existing:
+            print(f"File exists, skipping: {output_path}")
+        else:
+            pending.append((url, output_path))
+
+    if pending:
+        output_dir.mkdir(parents=True, exist_ok=True)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def bounded(url: str, output_path: Path) -> Path:
+            async with semaphore:
+                return await _download_one(client, url, output_path)
+
+        async with httpx.AsyncClient(http2=True, timeout=60, follow_redirects=True) as client:
+            try:
+                async with asyncio.TaskGroup() as group:
+                    for url, output_path in pending:
+                        group.create_task(bounded(url, output_path))
+            except ExceptionGroup as errors:
+                # Surface the first failure, chained to the group so the
+                # other failures stay in the traceback
+                raise errors.exceptions[0] from errors
+
+    return [output_path for _, output_path in targets]
+
+
+def download_taxi_data_simple(year: int, month: int, output_dir: Path) -> Path:
+    """
+    Download one month of NYC Taxi data.
+
+    Synchronous wrapper around download_many() for a single month.
+    """
+    return asyncio.run(download_many([(year, month)], output_dir))[0]
+
+
+def main() -> None:
+    """Download the requested months of a year into RAW_DIR."""
+    parser = argparse.ArgumentParser(description="Download NYC taxi trip data")
+    parser.add_argument("year", type=int, help="Year to download")
+    parser.add_argument(
+        "months", type=int, nargs="*", default=list(range(1, 13)),
+        help="Months to download (default: all)",
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="Simultaneous downloads")
+    args = parser.parse_args()
+
+    ensure_dirs()
+    months = [(args.year, month) for month in args.months]
+    asyncio.run(download_many(months, RAW_DIR, concurrency=args.concurrency))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Load validated trip data into Postgres."""
+import argparse
+import logging
+from pathlib import Path
+from typing import Iterator
+
+import adbc_driver_postgresql.dbapi as adbc
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.config import STAGING_DIR, ensure_dirs, get_db_config
+from src.utils.logger import configure_once
+
+logger = logging.getLogger(__name__)
+
+# Raw columns of staging.trip_raw (sql/01_init_schema.sql), all TEXT
+TRIP_RAW_COLUMNS = [
+    "vendorid", "tpep_pickup_datetime", "tpep_dropoff_datetime",
+    "passenger_count", "trip_distance", "ratecodeid", "store_and_fwd_flag",
+    "pulocationid", "dolocationid", "payment_type", "fare_amount", "extra",
+    "mta_tax", "tip_amount", "tolls_amount", "improvement_surcharge",
+    "total_amount", "congestion_surcharge", "airport_fee",
+]
+
+
+def load_arrow(table: str, batch: pa.RecordBatch | pa.Table | pa.RecordBatchReader) -> int:
+    """
+    Append Arrow data to a table using binary COPY through ADBC.
+
+    Columns go from Arrow buffers straight onto the COPY wire protocol,
+    with no per-row Python work and no text conversion. Uses its own ADBC
+    connection rather than the psycopg pool; the load is committed as one
+    transaction.
+
+    Args:
+        table: Target table, optionally schema-qualified (e.g., 'staging.trip_raw')
+        batch: Rows to load; column names must match the table's. A
+            RecordBatchReader is streamed without materializing it
+
+    Returns:
+        Number of rows loaded
+
+    Example:
+        >>> valid_path, rejected_path = split_parquet(path)
+        >>> load_arrow('staging.trip_raw', pq.read_table(valid_path))
+    """
+    schema, _, name = table.rpartition(".")
+    with adbc.connect(get_db_config().connection_string) as conn:
+        with conn.cursor() as cur:
+            rows = cur.adbc_ingest(name, batch, mode="append", db_schema_name=schema or None)
+        conn.commit()
+
+    logger.debug(f"Loaded {rows} rows into {table}")
+    return rows
+
+
+def _trip_raw_batches(path: Path) -> pa.RecordBatchReader:
+    """Stream a parquet file as staging.trip_raw rows: text columns plus source_file."""
+    parquet = pq.ParquetFile(path)
+    # TLC files use mixed-case names; older years lack some columns
+    names = {name.lower(): name for name in parquet.schema_arrow.names}
+    columns = [column for column in TRIP_RAW_COLUMNS if column in names]
+    schema = pa.schema([(column, pa.string()) for column in columns + ["source_file"]])
+
+    def batches() -> Iterator[pa.RecordBatch]:
+        for batch in parquet.iter_batches(columns=[names[c] for c in columns]):
+            arrays = [batch.column(names[c]).cast(pa.string()) for c in columns]
+            arrays.append(pa.array([path.name] * batch.num_rows, pa.string()))
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+    return pa.RecordBatchReader.from_batches(schema, batches())
+
+
+def main() -> None:
+    """Load staged parquet files into staging.trip_raw."""
+    parser = argparse.ArgumentParser(description="Load staged trip data into Postgres")
+    parser.add_argument(
+        "paths", type=Path, nargs="*",
+        help="Parquet files to load (default: all files in STAGING_DIR)",
+    )
+    args = parser.parse_args()
+
+    configure_once()
+    ensure_dirs()
+    paths = args.paths or sorted(STAGING_DIR.glob("*.parquet"))
+    if not paths:
+        raise SystemExit(f"No parquet files to load in {STAGING_DIR}")
+
+    for path in paths:
+        rows = load_arrow("staging.trip_raw", _trip_raw_batches(path))
+        logger.info(f"Loaded {rows} rows from {path.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Pipeline entry point."""
+import argparse
+import asyncio
+
+from src import envs
+from src.config import RAW_DIR, ensure_dirs
+from src.extract.downloader import download_many
+from src.utils.logger import LogContext, configure_once, get_logger
+
+
+def main() -> None:
+    """
+    Run the pipeline for the requested months.
+
+    Only the extract stage exists so far; later stages hook in after it.
+    The year defaults to PIPELINE_YEAR, so the container runs with no args.
+
+    Example:
+        $ python -m src.main 2024 1 2 3
+    """
+    parser = argparse.ArgumentParser(description="Run the NYC taxi pipeline")
+    parser.add_argument(
+        "year", type=int, nargs="?", default=envs.PIPELINE_YEAR,
+        help="Year to process (default: PIPELINE_YEAR)",
+    )
+    parser.add_argument(
+        "months", type=int, nargs="*", default=list(range(1, 13)),
+        help="Months to process (default: all)",
+    )
+    args = parser.parse_args()
+
+    configure_once()
+    ensure_dirs()
+    logger = get_logger(__name__)
+
+    months = [(args.year, month) for month in args.months]
+    with LogContext(logger, year=args.year, stage="extract"):
+        logger.info(f"Downloading {len(months)} month(s) to {RAW_DIR}")
+        paths = asyncio.run(download_many(months, RAW_DIR))
+        logger.info(f"Extract complete: {len(paths)} file(s)")
+
+
+if __name__ == "__main__":
+    main()
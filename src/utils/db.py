@@ -1,79 +1,99 @@
 """Database connection utilities with context manager pattern."""
-import psycopg2
-import psycopg2.extras
+import atexit
+import psycopg
+import threading
 from contextlib import contextmanager
-from typing import Generator
+from functools import lru_cache
+from psycopg import sql
+from psycopg_pool import ConnectionPool
+from typing import Generator, Iterable
 import logging
 
-from src.config import db_config
+from src import envs
+from src.config import get_db_config
 
 logger = logging.getLogger(__name__)
 
+# Process-wide connection pool, created lazily on first checkout
+_POOL: ConnectionPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _get_pool() -> ConnectionPool:
+    """
+    Return the shared connection pool, creating it on first use.
+    
+    Connections are checked out and returned instead of opened and closed
+    per call, so repeated queries skip the TCP/auth handshake. Blocks until
+    the minimum number of connections is ready, up to POSTGRES_POOL_TIMEOUT
+    seconds, so an unreachable database fails here rather than hanging.
+    """
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                db_config = get_db_config()
+                pool = ConnectionPool(
+                    kwargs={
+                        "host": db_config.host,
+                        "port": db_config.port,
+                        "user": db_config.user,
+                        "password": db_config.password,
+                        "dbname": db_config.database,
+                    },
+                    min_size=2,
+                    max_size=envs.POSTGRES_POOL_MAX,
+                    timeout=envs.POSTGRES_POOL_TIMEOUT,
+                    open=True,
+                )
+                try:
+                    pool.wait(timeout=envs.POSTGRES_POOL_TIMEOUT)
+                except BaseException:
+                    # Stop the pool's background reconnect attempts; the
+                    # next call starts over with a fresh pool
+                    pool.close()
+                    raise
+                atexit.register(pool.close)
+                _POOL = pool
+                logger.debug(
+                    f"Connection pool created: {db_config.host}:{db_config.port}/{db_config.database}"
+                )
+    return _POOL
+
 
 @contextmanager
-def get_db_connection(autocommit: bool = False) -> Generator[psycopg2.extensions.connection, None, None]:
+def get_db_connection(autocommit: bool = False) -> Generator[psycopg.Connection, None, None]:
     """
     Context manager for database connections.
     
     Automatically handles connection lifecycle:
-    - Opens connection
+    - Checks out a connection from the shared pool
     - Commits on success (if not autocommit)
     - Rolls back on error
-    - Always closes connection
+    - Always returns connection to the pool
     
     Args:
         autocommit: If True, sets connection to autocommit mode.
                    Use for DDL statements (CREATE TABLE, etc.)
     
     Yields:
-        psycopg2 connection object
+        psycopg connection object
         
     Example:
         >>> with get_db_connection() as conn:
         ...     with conn.cursor() as cur:
         ...         cur.execute("INSERT INTO table VALUES (%s)", (value,))
-        # Connection auto-commits and closes here
+        # Connection auto-commits and returns to the pool here
         
     Raises:
-        psycopg2.Error: If connection fails or query errors occur
+        psycopg.Error: If connection fails or query errors occur
     """
-    conn = None
-    try:
-        # Create connection using config
-        conn = psycopg2.connect(
-            host=db_config.host,
-            port=db_config.port,
-            user=db_config.user,
-            password=db_config.password,
-            database=db_config.database,
-        )
-        
-        # Set autocommit mode if requested
+    # The pool's context commits on success, rolls back on error and
+    # returns the connection (replacing it if broken)
+    with _get_pool().connection() as conn:
+        # Set autocommit mode explicitly, pooled connections keep prior state
         conn.autocommit = autocommit
-        
-        logger.debug(
-            f"Database connection established: {db_config.host}:{db_config.port}/{db_config.database}"
-        )
-        
         yield conn
-        
-        # Commit if not in autocommit mode and no exceptions occurred
-        if not autocommit and not conn.closed:
-            conn.commit()
-            logger.debug("Transaction committed successfully")
-            
-    except psycopg2.Error as e:
-        # Rollback on any database error
-        if conn and not conn.closed and not autocommit:
-            conn.rollback()
-            logger.error(f"Transaction rolled back due to error: {e}")
-        raise
-        
-    finally:
-        # Always close connection
-        if conn and not conn.closed:
-            conn.close()
-            logger.debug("Database connection closed")
 
 
 def execute_query(query: str, params: tuple = None, fetch: bool = False) -> list | None:
@@ -107,7 +127,8 @@ def execute_many(query: str, data: list[tuple]) -> int:
     """
     Execute a query with multiple parameter sets (bulk insert/update).
     
-    More efficient than individual execute() calls for batch operations.
+    Runs in pipeline mode, so all parameter sets are sent without waiting
+    for each result and the batch costs a single network round-trip.
     
     Args:
         query: SQL query with parameter placeholders
@@ -121,16 +142,54 @@ def execute_many(query: str, data: list[tuple]) -> int:
         >>> execute_many("INSERT INTO users (id, name) VALUES (%s, %s)", data)
         3
     """
+    with get_db_connection() as conn:
+        with conn.pipeline(), conn.cursor() as cur:
+            cur.executemany(query, data)
+        return cur.rowcount
+
+
+def copy_from_iter(table: str, columns: list[str], rows: Iterable[tuple]) -> int:
+    """
+    Bulk load rows into a table with COPY FROM STDIN.
+    
+    COPY skips the per-statement parse/plan cycle of INSERT, so it is the
+    fastest path for raw ingest. Rows are consumed lazily, so a generator
+    can be passed without materializing the whole batch.
+    
+    Args:
+        table: Target table, optionally schema-qualified (e.g., 'staging.trip_raw')
+        columns: Column names, in the same order as each row's values
+        rows: Iterable of tuples, one per row
+        
+    Returns:
+        Number of rows copied
+        
+    Example:
+        >>> rows = [(1, 15.0), (2, 9.5)]
+        >>> copy_from_iter('staging.trip_raw', ['vendorid', 'fare_amount'], rows)
+        2
+    """
+    query = sql.SQL("COPY {} ({}) FROM STDIN").format(
+        sql.Identifier(*table.split(".")),
+        sql.SQL(", ").join(map(sql.Identifier, columns)),
+    )
     with get_db_connection() as conn:
         with conn.cursor() as cur:
-            psycopg2.extras.execute_batch(cur, query, data)
+            with cur.copy(query) as copy:
+                for row in rows:
+                    copy.write_row(row)
             return cur.rowcount
 
 
+@lru_cache(maxsize=256)
 def table_exists(schema: str, table: str) -> bool:
     """
     Check if a table exists in the database.
     
+    Results are cached for the life of the process, since table existence
+    doesn't change during a run. Code that runs DDL should call
+    table_exists.cache_clear() afterwards.
+    
     Args:
         schema: Schema name (e.g., 'staging', 'warehouse')
         table: Table name
@@ -142,13 +201,32 @@ def table_exists(schema: str, table: str) -> bool:
         >>> if table_exists('staging', 'trip_raw'):
         ...     print("Table exists!")
     """
+    return tables_exist([(schema, table)])[(schema, table)]
+
+
+def tables_exist(pairs: list[tuple[str, str]]) -> dict[tuple[str, str], bool]:
+    """
+    Check whether several tables exist, in a single query.
+    
+    Args:
+        pairs: (schema, table) pairs to check
+        
+    Returns:
+        Mapping of each (schema, table) pair to whether it exists
+        
+    Example:
+        >>> tables_exist([('staging', 'trip_raw'), ('audit', 'pipeline_run')])
+        {('staging', 'trip_raw'): True, ('audit', 'pipeline_run'): False}
+    """
     query = """
-        SELECT EXISTS (
-            SELECT 1 
-            FROM information_schema.tables 
-            WHERE table_schema = %s 
-            AND table_name = %s
+        SELECT table_schema::text, table_name::text
+        FROM information_schema.tables 
+        WHERE (table_schema::text, table_name::text) IN (
+            SELECT * FROM unnest(%s::text[], %s::text[])
         );
     """
-    result = execute_query(query, (schema, table), fetch=True)
-    return result[0][0] if result else False
+    schemas = [schema for schema, _ in pairs]
+    tables = [table for _, table in pairs]
+    result = execute_query(query, (schemas, tables), fetch=True)
+    found = set(result) if result else set()
+    return {pair: pair in found for pair in pairs}
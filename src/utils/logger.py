@@ -1,13 +1,33 @@
 """Structured logging configuration for the pipeline."""
+import copy
 import logging
 import logging.config
 import sys
+import threading
+from contextvars import ContextVar
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 import yaml
 
+from src import envs
 from src.config import PROJECT_ROOT
 
+_CONFIGURED = False
+_CONFIGURE_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=4)
+def _load_yaml(path_str: str, mtime: float) -> dict:
+    """
+    Parse a YAML logging config.
+    
+    Cached per path and modification time, so repeated setup skips the
+    YAML parse until the file changes.
+    """
+    with open(path_str, 'r') as f:
+        return yaml.safe_load(f)
+
 
 def setup_logging(config_path: Optional[Path] = None, log_level: Optional[str] = None) -> None:
     """
@@ -22,33 +42,79 @@ def setup_logging(config_path: Optional[Path] = None, log_level: Optional[str] =
     if config_path is None:
         config_path = PROJECT_ROOT / "config" / "logging.yaml"
     
+    level = _parse_level(log_level)
+    
     # Try to load YAML config
     if config_path.exists():
         try:
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                logging.config.dictConfig(config)
+            config = _load_yaml(str(config_path), config_path.stat().st_mtime)
+            # dictConfig consumes its input, so keep the cached copy intact
+            logging.config.dictConfig(copy.deepcopy(config))
             
             # Override log level if specified
-            if log_level:
-                logging.getLogger().setLevel(log_level.upper())
+            if level is not None:
+                _apply_level(level)
                 
         except Exception as e:
             # Fall back to basic config if YAML parsing fails
-            _setup_basic_logging(log_level)
+            _setup_basic_logging(level)
             logging.warning(f"Failed to load logging config from {config_path}: {e}")
     else:
-        _setup_basic_logging(log_level)
+        _setup_basic_logging(level)
         logging.warning(f"Logging config not found at {config_path}, using basic config")
+    
+    if log_level and level is None:
+        logging.warning(f"Ignoring unknown log level {log_level!r}")
+
+
+def _parse_level(log_level: Optional[str]) -> Optional[int]:
+    """Return the numeric level for a level name, or None if unset or unknown."""
+    if not log_level:
+        return None
+    level = logging.getLevelName(log_level.upper())
+    return level if isinstance(level, int) else None
+
+
+def _apply_level(level: int) -> None:
+    """
+    Override levels set by the YAML config.
+    
+    Applies to the root and 'src' loggers and their console handlers; the
+    pipeline's loggers don't propagate to root, so root alone isn't enough.
+    File handlers keep their own level.
+    """
+    for logger in (logging.getLogger(), logging.getLogger("src")):
+        logger.setLevel(level)
+        for handler in logger.handlers:
+            if not isinstance(handler, logging.FileHandler):
+                handler.setLevel(level)
 
 
-def _setup_basic_logging(log_level: Optional[str] = None) -> None:
+def configure_once() -> None:
+    """
+    Configure logging on first call; later calls are no-ops.
+    
+    Called by entry points and lazily by get_logger(), so importing this
+    module doesn't touch the filesystem. Honors the LOG_LEVEL env var;
+    an unknown level is ignored with a warning.
+    """
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+    with _CONFIGURE_LOCK:
+        if not _CONFIGURED:
+            setup_logging(log_level=envs.LOG_LEVEL)
+            _CONFIGURED = True
+
+
+def _setup_basic_logging(level: Optional[int] = None) -> None:
     """
     Configure basic logging as fallback.
     
     Logs to both console and file with consistent formatting.
     """
-    level = getattr(logging, log_level.upper()) if log_level else logging.INFO
+    if level is None:
+        level = logging.INFO
     
     # Create formatter
     formatter = logging.Formatter(
@@ -77,6 +143,8 @@ def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
     
+    Configures logging on first use if no entry point has done so yet.
+    
     Args:
         name: Logger name (typically __name__ of the calling module)
         
@@ -87,18 +155,38 @@ def get_logger(name: str) -> logging.Logger:
         >>> logger = get_logger(__name__)
         >>> logger.info("Processing started")
     """
+    configure_once()
     return logging.getLogger(name)
 
 
+# Context added by active LogContext blocks, with its pre-formatted message
+# prefix; per thread/task, so concurrent contexts don't see each other's values
+_LOG_CONTEXT: ContextVar[tuple[dict, str]] = ContextVar("log_context", default=({}, ""))
+
+
+class ContextFilter(logging.Filter):
+    """Prefix log messages with the active LogContext key-value pairs."""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        _, prefix = _LOG_CONTEXT.get()
+        if prefix:
+            record.msg = prefix + str(record.msg)
+        return True
+
+
 class LogContext:
     """
     Context manager for adding temporary context to log messages.
     
+    Context is held in a ContextVar and applied by a ContextFilter on the
+    given logger, so nested blocks merge their context and concurrent
+    threads or tasks each keep their own.
+    
     Example:
         >>> logger = get_logger(__name__)
         >>> with LogContext(logger, run_id="20240115_001", stage="extract"):
         ...     logger.info("Processing file")
-        # Output: ... - extract - run_id=20240115_001 - Processing file
+        # Output: ... - run_id=20240115_001 - stage=extract - Processing file
     """
     
     def __init__(self, logger: logging.Logger, **context):
@@ -111,26 +199,21 @@ class LogContext:
         """
         self.logger = logger
         self.context = context
-        self.old_factory = None
+        self.token = None
     
     def __enter__(self):
         """Add context to logger on entry."""
-        self.old_factory = logging.getLogRecordFactory()
+        # Install the filter once per logger
+        if not any(isinstance(f, ContextFilter) for f in self.logger.filters):
+            self.logger.addFilter(ContextFilter())
         
-        def record_factory(*args, **kwargs):
-            record = self.old_factory(*args, **kwargs)
-            # Add context to the message
-            context_str = " - ".join(f"{k}={v}" for k, v in self.context.items())
-            record.msg = f"{context_str} - {record.msg}"
-            return record
-        
-        logging.setLogRecordFactory(record_factory)
+        # Context is fixed for the block, so format the prefix once here
+        # rather than for every record
+        context = {**_LOG_CONTEXT.get()[0], **self.context}
+        prefix = " - ".join(f"{k}={v}" for k, v in context.items()) + " - "
+        self.token = _LOG_CONTEXT.set((context, prefix))
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Restore original log factory on exit."""
-        logging.setLogRecordFactory(self.old_factory)
-
-
-# Initialize logging on module import
-setup_logging()
+        """Restore the enclosing context on exit."""
+        _LOG_CONTEXT.reset(self.token)
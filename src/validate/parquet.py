@@ -0,0 +1,76 @@
+"""Validation of trip parquet files with Polars lazy queries."""
+from pathlib import Path
+import polars as pl
+
+from src.config import REJECTED_DIR, STAGING_DIR
+from src.validate.schemas import INT_COLUMNS, RANGE_RULES
+
+
+def valid_expr() -> pl.Expr:
+    """
+    Build a boolean expression that is True for rows TripRecord accepts.
+
+    Uses the same rules as validate_batch(), evaluated by Polars' native
+    kernels over Arrow buffers. Null results count as invalid.
+    """
+    expr = pl.col("tpep_dropoff_datetime") > pl.col("tpep_pickup_datetime")
+
+    for column, (low, high) in RANGE_RULES.items():
+        values = pl.col(column).cast(pl.Float64)
+        expr &= values.is_not_null()
+        # Polars orders NaN above every number, so reject it explicitly
+        # wherever TripRecord's bounds would
+        if low is not None or high is not None:
+            expr &= values.is_not_nan()
+        if low is not None:
+            expr &= values >= low
+        if high is not None:
+            expr &= values <= high
+
+    for column in INT_COLUMNS:
+        expr &= pl.col(column).cast(pl.Float64) % 1 == 0
+
+    return expr.fill_null(False)
+
+
+def scan_trips(path: Path) -> pl.LazyFrame:
+    """Lazily scan a trip parquet file, lowercasing TLC's column names."""
+    return pl.scan_parquet(path).rename(str.lower)
+
+
+def split_parquet(
+    path: Path,
+    valid_dir: Path = STAGING_DIR,
+    rejected_dir: Path = REJECTED_DIR,
+) -> tuple[Path, Path]:
+    """
+    Split a trip parquet file into valid and rejected parquet files.
+
+    Both sides are lazy sinks run together by one collect_all(), so the
+    source is scanned once and streamed straight to disk; neither side
+    is ever held in memory as a whole. No per-row Python runs.
+
+    Args:
+        path: Parquet file as downloaded from the TLC CDN
+        valid_dir: Directory for the valid rows, written under path's name
+        rejected_dir: Directory for the rejected rows, written under path's name
+
+    Returns:
+        (valid path, rejected path), both files with lowercase column names
+
+    Example:
+        >>> valid_path, rejected_path = split_parquet(RAW_DIR / "yellow_tripdata_2024-01.parquet")
+    """
+    trips = scan_trips(path)
+    is_valid = valid_expr()
+
+    valid_path = valid_dir / path.name
+    rejected_path = rejected_dir / path.name
+    for output_dir in (valid_dir, rejected_dir):
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    pl.collect_all([
+        trips.filter(is_valid).sink_parquet(valid_path, lazy=True),
+        trips.filter(~is_valid).sink_parquet(rejected_path, lazy=True),
+    ])
+    return valid_path, rejected_path
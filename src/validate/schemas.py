@@ -1,8 +1,41 @@
 """Data contracts and validation schemas."""
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+# Inclusive (min, max) bounds per column, mirroring TripRecord, for the
+# validators that don't go through Pydantic.
+# None means unbounded on that side; every listed column must be non-null.
+# As in TripRecord, NaN fails any bound, while a column with no bounds
+# (total_amount) accepts NaN and +/-inf.
+RANGE_RULES: dict[str, tuple[float | None, float | None]] = {
+    "vendorid": (1, 2),
+    "passenger_count": (0, 9),
+    "trip_distance": (0, 500),
+    "ratecodeid": (1, 6),
+    "pulocationid": (1, 265),
+    "dolocationid": (1, 265),
+    "payment_type": (1, 6),
+    "fare_amount": (0, None),
+    "extra": (0, None),
+    "mta_tax": (0, None),
+    "tip_amount": (0, None),
+    "tolls_amount": (0, None),
+    "total_amount": (None, None),
+}
+
+# Columns TripRecord types as int; parquet often stores them as float
+INT_COLUMNS = (
+    "vendorid",
+    "passenger_count",
+    "ratecodeid",
+    "pulocationid",
+    "dolocationid",
+    "payment_type",
+)
+
+
 class TripRecord(BaseModel):
     """Expected schema for NYC taxi trip records."""
     
@@ -45,3 +78,46 @@ class TripRecord(BaseModel):
         return v
 
 
+@dataclass(slots=True, frozen=True)
+class TripRecordFast:
+    """
+    Lightweight trip record for hot paths.
+    
+    Applies the same rules as TripRecord with plain comparisons in
+    __post_init__, skipping Pydantic's model machinery, and uses __slots__
+    so large batches of records take less memory. Values are not coerced,
+    so callers pass already-typed data. Use TripRecord at API boundaries
+    where detailed error messages matter.
+    
+    Raises:
+        ValueError: If any field breaks a rule
+    """
+    vendorid: int
+    tpep_pickup_datetime: datetime
+    tpep_dropoff_datetime: datetime
+    passenger_count: int
+    trip_distance: float
+    ratecodeid: int
+    pulocationid: int
+    dolocationid: int
+    payment_type: int
+    fare_amount: float
+    extra: float
+    mta_tax: float
+    tip_amount: float
+    tolls_amount: float
+    total_amount: float
+    
+    def __post_init__(self):
+        """Validate ranges, whole-number ints and dropoff after pickup."""
+        for name, (low, high) in RANGE_RULES.items():
+            value = getattr(self, name)
+            # Written as 'not (...)' so NaN fails every comparison
+            if value is None or (low is not None and not value >= low) \
+                    or (high is not None and not value <= high):
+                raise ValueError(f"{name} out of range: {value!r}")
+        for name in INT_COLUMNS:
+            if getattr(self, name) % 1:
+                raise ValueError(f"{name} must be a whole number")
+        if self.tpep_dropoff_datetime <= self.tpep_pickup_datetime:
+            raise ValueError("Dropoff must be after pickup")
@@ -0,0 +1,50 @@
+"""Vectorized validation of trip record batches."""
+import numpy as np
+import pandas as pd
+
+from src.validate.schemas import INT_COLUMNS, RANGE_RULES
+
+
+def validate_batch(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Split a batch of trip records into valid and rejected rows.
+
+    Applies the same rules as TripRecord, but as whole-column boolean masks
+    instead of building one Pydantic model per row.
+
+    Args:
+        df: Trip records; column names are matched case-insensitively, so
+            TLC's mixed-case names (e.g. 'VendorID') work as-is
+
+    Returns:
+        (valid, rejected) DataFrames with lowercase column names, each
+        keeping the original index
+
+    Example:
+        >>> valid, rejected = validate_batch(pd.read_parquet(path))
+        >>> rejected_pct = 100 * len(rejected) / len(df)
+    """
+    df = df.rename(columns=str.lower)
+    # Parse timestamps once per column; NaT compares False so is rejected
+    pickup = pd.to_datetime(df["tpep_pickup_datetime"])
+    dropoff = pd.to_datetime(df["tpep_dropoff_datetime"])
+    mask = dropoff > pickup
+
+    for column, (low, high) in RANGE_RULES.items():
+        values = df[column]
+        # NaN in a NumPy float column is a value, as it is for TripRecord,
+        # and fails the bounds where there are any; other missing values
+        # (None, <NA> in nullable dtypes) are nulls and always rejected
+        if not (isinstance(values.dtype, np.dtype) and values.dtype.kind == "f"):
+            mask &= values.notna()
+        if low is not None:
+            mask &= values >= low
+        if high is not None:
+            mask &= values <= high
+
+    for column in INT_COLUMNS:
+        mask &= df[column] % 1 == 0
+
+    # Nullable dtypes can leave <NA> in the mask; treat those as invalid
+    mask = mask.fillna(False).astype(bool)
+    return df[mask], df[~mask]
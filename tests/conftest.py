@@ -0,0 +1,19 @@
+"""Shared pytest fixtures."""
+import psycopg
+import pytest
+
+from src.config import get_db_config
+
+
+@pytest.fixture(scope="session")
+def db_available():
+    """
+    Skip database tests if Postgres isn't reachable, checked once per session.
+
+    Probes with one short-timeout connection rather than the pool, which
+    keeps retrying for POSTGRES_POOL_TIMEOUT seconds before giving up.
+    """
+    try:
+        psycopg.connect(get_db_config().connection_string, connect_timeout=2).close()
+    except psycopg.OperationalError:
+        pytest.skip("Database not available (make sure Docker containers are running: make up)")
@@ -0,0 +1,25 @@
+"""Shared test helpers."""
+from datetime import datetime
+
+
+def make_trip(**overrides) -> dict:
+    """A valid trip record, with optional field overrides."""
+    trip = dict(
+        vendorid=1,
+        tpep_pickup_datetime=datetime(2024, 1, 1, 10, 0),
+        tpep_dropoff_datetime=datetime(2024, 1, 1, 10, 30),
+        passenger_count=2,
+        trip_distance=5.5,
+        ratecodeid=1,
+        pulocationid=100,
+        dolocationid=200,
+        payment_type=1,
+        fare_amount=15.0,
+        extra=0.5,
+        mta_tax=0.5,
+        tip_amount=3.0,
+        tolls_amount=0.0,
+        total_amount=19.0,
+    )
+    trip.update(overrides)
+    return trip
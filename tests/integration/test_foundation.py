@@ -0,0 +1,51 @@
+"""Integration tests against the pipeline's Postgres database."""
+import pytest
+
+from src.utils import get_db_connection
+from src.utils.db import copy_from_iter, execute_query, tables_exist
+
+
+@pytest.mark.integration
+def test_database_connection(db_available):
+    """Test a query round-trips through the pool."""
+    with get_db_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT version();")
+            version = cur.fetchone()[0]
+
+    assert version.startswith("PostgreSQL")
+
+
+@pytest.mark.integration
+def test_tables_exist(db_available):
+    """Test the schema from sql/01_init_schema.sql is in place."""
+    expected = [
+        ('staging', 'trip_raw'),
+        ('warehouse', 'fact_trip'),
+        ('warehouse', 'dim_vendor'),
+        ('audit', 'pipeline_run'),
+    ]
+
+    found = tables_exist([*expected, ('staging', 'no_such_table')])
+
+    assert [pair for pair in expected if not found[pair]] == []
+    assert found[('staging', 'no_such_table')] is False
+
+
+@pytest.mark.integration
+def test_copy_from_iter(db_available):
+    """Test the composed COPY statement loads rows into a schema-qualified table."""
+    execute_query("DROP TABLE IF EXISTS staging.copy_test")
+    execute_query('CREATE TABLE staging.copy_test (vendorid TEXT, "FareAmount" TEXT)')
+    try:
+        copied = copy_from_iter(
+            'staging.copy_test', ['vendorid', 'FareAmount'], iter([("1", "15.0"), ("2", "9.5")])
+        )
+        rows = execute_query(
+            'SELECT vendorid, "FareAmount" FROM staging.copy_test ORDER BY vendorid', fetch=True
+        )
+    finally:
+        execute_query("DROP TABLE staging.copy_test")
+
+    assert copied == 2
+    assert rows == [("1", "15.0"), ("2", "9.5")]
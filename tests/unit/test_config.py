@@ -0,0 +1,65 @@
+"""Unit tests for pipeline configuration."""
+from unittest.mock import patch
+
+import pytest
+
+from src import config
+from src.config import RAW_DIR, ensure_dirs, get_db_config, get_pipeline_config
+
+
+@pytest.fixture
+def fresh_config():
+    """Drop cached config objects before and after a test."""
+    get_db_config.cache_clear()
+    get_pipeline_config.cache_clear()
+    yield
+    get_db_config.cache_clear()
+    get_pipeline_config.cache_clear()
+
+
+class TestConfig:
+    """Tests for config loading."""
+
+    def test_sensible_values(self):
+        """Test config loads with sensible values."""
+        db_config = get_db_config()
+        pipeline_config = get_pipeline_config()
+
+        assert db_config.host
+        assert db_config.port > 0
+        assert RAW_DIR.name == "raw"
+        assert pipeline_config.batch_size > 0
+
+
+class TestCachedGetters:
+    """Tests for the process-wide config getters."""
+
+    def test_same_object_returned(self, fresh_config):
+        """Test repeated calls share one config object."""
+        assert get_db_config() is get_db_config()
+        assert get_pipeline_config() is get_pipeline_config()
+
+    @patch('src.config.DatabaseConfig')
+    def test_built_once(self, mock_config, fresh_config):
+        """Test the config is only built, and env only read, on the first call."""
+        get_db_config()
+        get_db_config()
+
+        mock_config.assert_called_once_with()
+
+
+class TestEnsureDirs:
+    """Tests for on-demand data directory creation."""
+
+    def test_creates_dirs_once(self, monkeypatch, tmp_path):
+        """Test the directories are created on the first call only."""
+        for name in ("RAW_DIR", "STAGING_DIR", "REJECTED_DIR"):
+            monkeypatch.setattr(config, name, tmp_path / name.lower())
+        monkeypatch.setattr(config, "_dirs_ensured", False)
+
+        ensure_dirs()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["raw_dir", "rejected_dir", "staging_dir"]
+
+        (tmp_path / "raw_dir").rmdir()
+        ensure_dirs()
+        assert not (tmp_path / "raw_dir").exists()
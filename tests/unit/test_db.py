@@ -1,83 +1,129 @@
 """Unit tests for database utilities."""
 import pytest
-import psycopg2
-from unittest.mock import patch, MagicMock, PropertyMock
+import psycopg
+from psycopg_pool import PoolTimeout
+from unittest.mock import patch, call, MagicMock, PropertyMock
 
+from src import envs
+from src.utils import db as src_db
 from src.utils.db import (
     get_db_connection,
     execute_query,
     execute_many,
-    table_exists
+    copy_from_iter,
+    table_exists,
+    tables_exist,
+    _get_pool,
 )
 
 
-@pytest.fixture
-def mock_connection():
-    """Mock psycopg2 connection for testing."""
-    conn = MagicMock(spec=psycopg2.extensions.connection)
+@pytest.fixture(scope="module")
+def _connection_mocks():
+    """Mock psycopg connection and cursor, built once per module."""
+    conn = MagicMock(spec=psycopg.Connection)
     # Use PropertyMock for the 'closed' attribute to ensure it stays False
     type(conn).closed = PropertyMock(return_value=False)
-    conn.autocommit = False
     cursor = MagicMock()
     conn.cursor.return_value.__enter__ = MagicMock(return_value=cursor)
     conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
     return conn, cursor
 
 
+@pytest.fixture
+def mock_connection(_connection_mocks):
+    """Mock psycopg connection for testing, reset after each test."""
+    conn, cursor = _connection_mocks
+    # Plain attributes survive reset_mock(), so set them fresh each test
+    conn.autocommit = False
+    cursor.rowcount = -1
+    yield conn, cursor
+    # Keep the conn -> cursor wiring, drop calls and per-test return values
+    conn.reset_mock()
+    cursor.reset_mock(return_value=True, side_effect=True)
+
+
+def _pool_yielding(mock_get_pool, conn):
+    """Configure a mocked pool whose connection() context yields conn."""
+    pool = mock_get_pool.return_value
+    pool.connection.return_value.__enter__ = MagicMock(return_value=conn)
+    pool.connection.return_value.__exit__ = MagicMock(return_value=False)
+    return pool
+
+
 class TestGetDBConnection:
     """Tests for get_db_connection context manager."""
     
-    @patch('src.utils.db.psycopg2.connect')
-    def test_connection_success(self, mock_connect, mock_connection):
-        """Test successful connection and commit."""
+    @patch('src.utils.db._get_pool')
+    def test_connection_success(self, mock_get_pool, mock_connection):
+        """Test connection is checked out and returned via the pool."""
         conn, cursor = mock_connection
-        mock_connect.return_value = conn
+        pool = _pool_yielding(mock_get_pool, conn)
         
         with get_db_connection() as db_conn:
             assert db_conn == conn
+            assert db_conn.autocommit is False
         
-        # Verify connection lifecycle
-        mock_connect.assert_called_once()
-        conn.commit.assert_called_once()
-        conn.close.assert_called_once()
+        # Verify connection lifecycle is delegated to the pool context
+        pool.connection.assert_called_once()
+        pool.connection.return_value.__exit__.assert_called_once_with(None, None, None)
+        conn.close.assert_not_called()
     
-    @patch('src.utils.db.psycopg2.connect')
-    def test_autocommit_mode(self, mock_connect, mock_connection):
-        """Test autocommit mode doesn't call commit()."""
+    @patch('src.utils.db._get_pool')
+    def test_autocommit_mode(self, mock_get_pool, mock_connection):
+        """Test autocommit mode is set on the checked out connection."""
         conn, cursor = mock_connection
-        mock_connect.return_value = conn
+        _pool_yielding(mock_get_pool, conn)
         
         with get_db_connection(autocommit=True) as db_conn:
             assert db_conn.autocommit is True
-        
-        # Should NOT call commit() in autocommit mode
-        conn.commit.assert_not_called()
-        conn.close.assert_called_once()
     
-    @patch('src.utils.db.psycopg2.connect')
-    def test_rollback_on_error(self, mock_connect, mock_connection):
-        """Test rollback occurs when exception is raised."""
+    @patch('src.utils.db._get_pool')
+    def test_error_propagates_to_pool(self, mock_get_pool, mock_connection):
+        """Test errors reach the pool context so it rolls back."""
         conn, cursor = mock_connection
-        mock_connect.return_value = conn
+        pool = _pool_yielding(mock_get_pool, conn)
         
-        with pytest.raises(psycopg2.DatabaseError):
+        with pytest.raises(psycopg.DatabaseError):
             with get_db_connection() as db_conn:
                 # Simulate a database error
-                raise psycopg2.DatabaseError("Test database error")
+                raise psycopg.DatabaseError("Test database error")
         
-        # Verify rollback called, not commit
-        conn.rollback.assert_called_once()
-        conn.commit.assert_not_called()
-        conn.close.assert_called_once()
+        exc_type = pool.connection.return_value.__exit__.call_args[0][0]
+        assert exc_type is psycopg.DatabaseError
     
-    @patch('src.utils.db.psycopg2.connect')
-    def test_connection_failure(self, mock_connect):
+    @patch('src.utils.db._get_pool')
+    def test_connection_failure(self, mock_get_pool):
         """Test handling of connection failure."""
-        mock_connect.side_effect = psycopg2.OperationalError("Connection refused")
+        pool = mock_get_pool.return_value
+        pool.connection.side_effect = psycopg.OperationalError("Connection refused")
         
-        with pytest.raises(psycopg2.OperationalError):
+        with pytest.raises(psycopg.OperationalError):
             with get_db_connection() as conn:
                 pass
+    
+    @patch('src.utils.db.ConnectionPool')
+    def test_pool_created_once(self, mock_pool_cls):
+        """Test the pool is created lazily, opened and reused."""
+        with patch('src.utils.db._POOL', None):
+            first = _get_pool()
+            second = _get_pool()
+        
+        assert first is second
+        mock_pool_cls.assert_called_once()
+        first.wait.assert_called_once_with(timeout=envs.POSTGRES_POOL_TIMEOUT)
+        assert mock_pool_cls.call_args.kwargs["timeout"] == envs.POSTGRES_POOL_TIMEOUT
+
+    @patch('src.utils.db.ConnectionPool')
+    def test_pool_closed_when_wait_fails(self, mock_pool_cls):
+        """Test an unreachable database doesn't leave a pool retrying in the background."""
+        mock_pool_cls.return_value.wait.side_effect = PoolTimeout("timed out")
+
+        with patch('src.utils.db._POOL', None):
+            with pytest.raises(PoolTimeout):
+                _get_pool()
+            assert src_db._POOL is None
+
+        mock_pool_cls.return_value.close.assert_called_once()
 
 
 class TestExecuteQuery:
@@ -117,9 +163,8 @@ class TestExecuteMany:
     """Tests for execute_many bulk operation function."""
     
     @patch('src.utils.db.get_db_connection')
-    @patch('src.utils.db.psycopg2.extras.execute_batch')
-    def test_bulk_insert(self, mock_batch, mock_get_conn, mock_connection):
-        """Test bulk insert operation."""
+    def test_bulk_insert(self, mock_get_conn, mock_connection):
+        """Test bulk insert runs executemany inside a pipeline."""
         conn, cursor = mock_connection
         mock_get_conn.return_value.__enter__ = MagicMock(return_value=conn)
         mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
@@ -130,17 +175,61 @@ class TestExecuteMany:
         
         rows_affected = execute_many(query, data)
         
-        mock_batch.assert_called_once_with(cursor, query, data)
+        conn.pipeline.assert_called_once()
+        cursor.executemany.assert_called_once_with(query, data)
         assert rows_affected == 3
 
 
+class TestCopyFromIter:
+    """Tests for copy_from_iter COPY loader."""
+    
+    @patch('src.utils.db.get_db_connection')
+    def test_copy_rows(self, mock_get_conn, mock_connection):
+        """Test a schema-qualified COPY is built and each row is written once."""
+        conn, cursor = mock_connection
+        mock_get_conn.return_value.__enter__ = MagicMock(return_value=conn)
+        mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
+        copy = cursor.copy.return_value.__enter__.return_value
+        cursor.rowcount = 2
+        
+        rows = iter([(1, 15.0), (2, 9.5)])
+        copied = copy_from_iter('staging.trip_raw', ['vendorid', 'fare_amount'], rows)
+        
+        cursor.copy.assert_called_once()
+        query = cursor.copy.call_args[0][0]
+        assert query.as_string() == (
+            'COPY "staging"."trip_raw" ("vendorid", "fare_amount") FROM STDIN'
+        )
+        assert copy.write_row.call_args_list == [call((1, 15.0)), call((2, 9.5))]
+        assert copied == 2
+
+    @patch('src.utils.db.get_db_connection')
+    def test_unqualified_table_and_quoted_columns(self, mock_get_conn, mock_connection):
+        """Test a bare table name and mixed-case columns are quoted as identifiers."""
+        conn, cursor = mock_connection
+        mock_get_conn.return_value.__enter__ = MagicMock(return_value=conn)
+        mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
+
+        copy_from_iter('trip_raw', ['VendorID'], [])
+
+        query = cursor.copy.call_args[0][0]
+        assert query.as_string() == 'COPY "trip_raw" ("VendorID") FROM STDIN'
+
+
 class TestTableExists:
     """Tests for table_exists utility function."""
     
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        """Start each test with an empty table_exists cache."""
+        table_exists.cache_clear()
+        yield
+        table_exists.cache_clear()
+    
     @patch('src.utils.db.execute_query')
     def test_table_exists_true(self, mock_execute):
         """Test when table exists."""
-        mock_execute.return_value = [(True,)]
+        mock_execute.return_value = [('staging', 'trip_raw')]
         
         result = table_exists('staging', 'trip_raw')
         
@@ -150,12 +239,22 @@ class TestTableExists:
     @patch('src.utils.db.execute_query')
     def test_table_exists_false(self, mock_execute):
         """Test when table does not exist."""
-        mock_execute.return_value = [(False,)]
+        mock_execute.return_value = []
         
         result = table_exists('staging', 'nonexistent_table')
         
         assert result is False
     
+    @patch('src.utils.db.execute_query')
+    def test_table_exists_cached(self, mock_execute):
+        """Test repeated checks reuse the first result."""
+        mock_execute.return_value = [('staging', 'trip_raw')]
+        
+        assert table_exists('staging', 'trip_raw') is True
+        assert table_exists('staging', 'trip_raw') is True
+        
+        mock_execute.assert_called_once()
+    
     @patch('src.utils.db.execute_query')
     def test_table_exists_query_failure(self, mock_execute):
         """Test handling of query failure."""
@@ -166,18 +265,36 @@ class TestTableExists:
         assert result is False
 
 
+class TestTablesExist:
+    """Tests for tables_exist batch check."""
+    
+    @patch('src.utils.db.execute_query')
+    def test_single_query_for_all_pairs(self, mock_execute):
+        """Test all pairs are checked in one query."""
+        mock_execute.return_value = [('staging', 'trip_raw'), ('audit', 'pipeline_run')]
+        pairs = [('staging', 'trip_raw'), ('warehouse', 'fact_trip'), ('audit', 'pipeline_run')]
+        
+        result = tables_exist(pairs)
+        
+        assert result == {
+            ('staging', 'trip_raw'): True,
+            ('warehouse', 'fact_trip'): False,
+            ('audit', 'pipeline_run'): True,
+        }
+        mock_execute.assert_called_once()
+        params = mock_execute.call_args[0][1]
+        assert params == (['staging', 'warehouse', 'audit'], ['trip_raw', 'fact_trip', 'pipeline_run'])
+
+
 # Integration test (requires running database)
 @pytest.mark.integration
 class TestDBIntegration:
     """Integration tests requiring actual database connection."""
     
-    def test_real_connection(self):
+    def test_real_connection(self, db_available):
         """Test actual database connection (only runs if DB available)."""
-        try:
-            with get_db_connection() as conn:
-                with conn.cursor() as cur:
-                    cur.execute("SELECT 1")
-                    result = cur.fetchone()
-                    assert result == (1,)
-        except psycopg2.OperationalError:
-            pytest.skip("Database not available for integration test")
+        with get_db_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+                result = cur.fetchone()
+                assert result == (1,)
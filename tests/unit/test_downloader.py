@@ -0,0 +1,159 @@
+"""Unit tests for the taxi data downloader."""
+import asyncio
+from unittest.mock import patch
+
+import aiofiles
+import httpx
+import pytest
+
+from src.extract.downloader import CHUNK_SIZE, download_many, download_taxi_data_simple
+
+
+@pytest.fixture
+def mock_http(monkeypatch):
+    """Route the downloader's HTTP client through an in-memory transport."""
+    responses = {}
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.path.rsplit("/", 1)[-1])
+        status, body = responses.get(seen[-1], (404, b""))
+        # A callable body is a factory for a streamed (async iterator) body
+        return httpx.Response(status, content=body() if callable(body) else body)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        "src.extract.downloader.httpx.AsyncClient",
+        lambda **kwargs: real_client(transport=httpx.MockTransport(handler), **kwargs),
+    )
+    return responses, seen
+
+
+class TestDownloadMany:
+    """Tests for concurrent multi-month downloads."""
+
+    def test_downloads_all_months(self, mock_http, tmp_path):
+        """Test every month is written and paths keep input order."""
+        responses, seen = mock_http
+        responses["yellow_tripdata_2024-01.parquet"] = (200, b"jan")
+        responses["yellow_tripdata_2024-02.parquet"] = (200, b"feb")
+
+        paths = asyncio.run(download_many([(2024, 1), (2024, 2)], tmp_path, concurrency=2))
+
+        assert [p.name for p in paths] == [
+            "yellow_tripdata_2024-01.parquet",
+            "yellow_tripdata_2024-02.parquet",
+        ]
+        assert paths[0].read_bytes() == b"jan"
+        assert paths[1].read_bytes() == b"feb"
+
+    def test_existing_months_skipped(self, mock_http, tmp_path):
+        """Test only months missing from output_dir are requested."""
+        responses, seen = mock_http
+        responses["yellow_tripdata_2024-02.parquet"] = (200, b"feb")
+        (tmp_path / "yellow_tripdata_2024-01.parquet").write_bytes(b"cached")
+
+        paths = asyncio.run(download_many([(2024, 1), (2024, 2)], tmp_path))
+
+        assert seen == ["yellow_tripdata_2024-02.parquet"]
+        assert paths[0].read_bytes() == b"cached"
+        assert paths[1].read_bytes() == b"feb"
+
+    def test_repeated_months_downloaded_once(self, mock_http, tmp_path):
+        """Test a month listed twice is fetched once instead of racing itself."""
+        responses, seen = mock_http
+        responses["yellow_tripdata_2024-01.parquet"] = (200, b"jan")
+
+        paths = asyncio.run(download_many([(2024, 1), (2024, 1)], tmp_path))
+
+        assert seen == ["yellow_tripdata_2024-01.parquet"]
+        assert paths == [tmp_path / "yellow_tripdata_2024-01.parquet"] * 2
+
+    def test_invalid_month_rejected_before_download(self, mock_http, tmp_path):
+        """Test bad input fails before any request is made."""
+        responses, seen = mock_http
+
+        with pytest.raises(ValueError):
+            asyncio.run(download_many([(2024, 1), (2024, 13)], tmp_path))
+
+        assert seen == []
+
+    def test_http_error_leaves_no_file(self, mock_http, tmp_path):
+        """Test a failed download raises and writes nothing."""
+        with pytest.raises(Exception, match="HTTP 404"):
+            asyncio.run(download_many([(2024, 3)], tmp_path))
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_all_failures_chained(self, mock_http, tmp_path):
+        """Test the raised error keeps every failure in its cause."""
+        with pytest.raises(Exception, match="HTTP 404") as excinfo:
+            asyncio.run(download_many([(2024, 3), (2024, 4)], tmp_path))
+
+        assert isinstance(excinfo.value.__cause__, ExceptionGroup)
+        assert excinfo.value in excinfo.value.__cause__.exceptions
+
+    def test_partial_file_never_counts_as_downloaded(self, mock_http, tmp_path):
+        """Test a leftover .part file fails loudly instead of being skipped."""
+        responses, seen = mock_http
+        responses["yellow_tripdata_2024-01.parquet"] = (200, b"jan")
+        (tmp_path / "yellow_tripdata_2024-01.parquet.part").write_bytes(b"ja")
+
+        with pytest.raises(Exception, match="Partial download exists"):
+            asyncio.run(download_many([(2024, 1)], tmp_path))
+
+        assert not (tmp_path / "yellow_tripdata_2024-01.parquet").exists()
+        assert seen == []
+
+    def test_streams_to_disk(self, mock_http, tmp_path):
+        """Test bytes reach the file while the response is still arriving."""
+        responses, seen = mock_http
+        part_path = tmp_path / "yellow_tripdata_2024-01.parquet.part"
+        sizes_mid_stream = []
+
+        async def body():
+            yield b"a" * (2 * CHUNK_SIZE)
+            sizes_mid_stream.append(part_path.stat().st_size)
+            yield b"b"
+
+        responses["yellow_tripdata_2024-01.parquet"] = (200, body)
+
+        paths = asyncio.run(download_many([(2024, 1)], tmp_path))
+
+        assert sizes_mid_stream[0] >= CHUNK_SIZE
+        assert paths[0].stat().st_size == 2 * CHUNK_SIZE + 1
+
+    def test_file_buffer_matches_chunk_size(self, mock_http, tmp_path):
+        """Test the output file buffers a full chunk, so each chunk is one write()."""
+        responses, seen = mock_http
+        responses["yellow_tripdata_2024-01.parquet"] = (200, b"jan")
+
+        with patch('src.extract.downloader.aiofiles.open', wraps=aiofiles.open) as mock_open:
+            asyncio.run(download_many([(2024, 1)], tmp_path))
+
+        assert mock_open.call_args.kwargs["buffering"] == CHUNK_SIZE
+
+    def test_no_part_file_left_after_success(self, mock_http, tmp_path):
+        """Test the partial file is renamed onto the final name."""
+        responses, seen = mock_http
+        responses["yellow_tripdata_2024-01.parquet"] = (200, b"jan")
+
+        asyncio.run(download_many([(2024, 1)], tmp_path))
+
+        assert [p.name for p in tmp_path.iterdir()] == ["yellow_tripdata_2024-01.parquet"]
+
+
+class TestDownloadTaxiDataSimple:
+    """Tests for the synchronous single-month wrapper."""
+
+    def test_skips_existing_file(self, mock_http, tmp_path):
+        """Test an existing file is returned without downloading."""
+        responses, seen = mock_http
+        existing = tmp_path / "yellow_tripdata_2024-01.parquet"
+        existing.write_bytes(b"cached")
+
+        path = download_taxi_data_simple(2024, 1, tmp_path)
+
+        assert path == existing
+        assert existing.read_bytes() == b"cached"
+        assert seen == []
@@ -0,0 +1,43 @@
+"""Unit tests for centralized environment variable access."""
+import pytest
+
+from src import envs
+
+
+@pytest.fixture
+def fresh_env(monkeypatch):
+    """Drop cached values so each test resolves variables again."""
+    for name in envs.environment_variables:
+        monkeypatch.delitem(vars(envs), name, raising=False)
+    yield monkeypatch
+    for name in envs.environment_variables:
+        vars(envs).pop(name, None)
+
+
+class TestEnvs:
+    """Tests for lazy env var resolution."""
+
+    def test_int_parsing(self, fresh_env):
+        """Test integer variables are parsed from the environment."""
+        fresh_env.setenv("POSTGRES_PORT", "6543")
+
+        assert envs.POSTGRES_PORT == 6543
+
+    def test_invalid_int_falls_back_to_default(self, fresh_env):
+        """Test malformed integers fall back to the default."""
+        fresh_env.setenv("POSTGRES_POOL_MAX", "lots")
+
+        assert envs.POSTGRES_POOL_MAX == 10
+
+    def test_value_cached_after_first_access(self, fresh_env):
+        """Test a variable is resolved once per process."""
+        fresh_env.setenv("POSTGRES_HOST", "db-1")
+        assert envs.POSTGRES_HOST == "db-1"
+
+        fresh_env.setenv("POSTGRES_HOST", "db-2")
+        assert envs.POSTGRES_HOST == "db-1"
+
+    def test_unknown_variable(self):
+        """Test undeclared variables raise AttributeError."""
+        with pytest.raises(AttributeError):
+            envs.NOT_A_REAL_VARIABLE
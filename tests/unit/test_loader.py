@@ -0,0 +1,65 @@
+"""Unit tests for Arrow loading."""
+import pyarrow as pa
+import pyarrow.parquet as pq
+from unittest.mock import patch
+
+from src.config import DatabaseConfig
+from src.load.loader import _trip_raw_batches, load_arrow
+
+
+class TestLoadArrow:
+    """Tests for load_arrow ADBC ingest."""
+
+    @patch('src.load.loader.adbc.connect')
+    def test_appends_to_schema_table(self, mock_connect):
+        """Test a schema-qualified table is split and appended, then committed."""
+        conn = mock_connect.return_value.__enter__.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.adbc_ingest.return_value = 2
+        batch = pa.RecordBatch.from_pydict({"vendorid": [1, 2]})
+
+        rows = load_arrow('staging.trip_raw', batch)
+
+        cursor.adbc_ingest.assert_called_once_with(
+            'trip_raw', batch, mode="append", db_schema_name='staging'
+        )
+        conn.commit.assert_called_once()
+        assert rows == 2
+
+    @patch('src.load.loader.adbc.connect')
+    def test_unqualified_table(self, mock_connect):
+        """Test a bare table name uses the connection's default schema."""
+        conn = mock_connect.return_value.__enter__.return_value
+        cursor = conn.cursor.return_value.__enter__.return_value
+
+        load_arrow('trip_raw', pa.table({"vendorid": [1]}))
+
+        assert cursor.adbc_ingest.call_args.kwargs["db_schema_name"] is None
+
+    @patch('src.load.loader.get_db_config')
+    @patch('src.load.loader.adbc.connect')
+    def test_credentials_quoted_in_uri(self, mock_connect, mock_config):
+        """Test reserved characters in the password don't break the URI."""
+        mock_config.return_value = DatabaseConfig(password='p@ss/word')
+
+        load_arrow('trip_raw', pa.table({"vendorid": [1]}))
+
+        assert ':p%40ss%2Fword@' in mock_connect.call_args[0][0]
+
+
+class TestTripRawBatches:
+    """Tests for shaping parquet files into staging.trip_raw rows."""
+
+    def test_text_columns_with_source_file(self, tmp_path):
+        """Test columns are lowercased, cast to text and tagged with the file name."""
+        path = tmp_path / "yellow_tripdata_2024-01.parquet"
+        pq.write_table(
+            pa.table({"VendorID": [1, 2], "fare_amount": [15.0, 7.5], "extra_col": [0, 0]}),
+            path,
+        )
+
+        table = _trip_raw_batches(path).read_all()
+
+        assert table.column_names == ["vendorid", "fare_amount", "source_file"]
+        assert table["vendorid"].to_pylist() == ["1", "2"]
+        assert table["source_file"].to_pylist() == [path.name] * 2
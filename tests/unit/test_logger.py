@@ -0,0 +1,146 @@
+"""Unit tests for logging utilities."""
+import logging
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import logger as logger_module
+from src.utils.logger import LogContext, _load_yaml, configure_once, get_logger, setup_logging
+
+
+@pytest.fixture
+def logger(caplog):
+    """A propagating test logger captured at INFO level."""
+    caplog.set_level(logging.INFO)
+    return get_logger("tests.unit.logcontext")
+
+
+class TestLogContext:
+    """Tests for LogContext message prefixing."""
+
+    def test_context_prefixes_messages(self, logger, caplog):
+        """Test messages inside the block carry the context."""
+        with LogContext(logger, run_id="20240115_001", stage="extract"):
+            logger.info("Processing file")
+        logger.info("Done")
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert messages == [
+            "run_id=20240115_001 - stage=extract - Processing file",
+            "Done",
+        ]
+
+    def test_nested_contexts_merge(self, logger, caplog):
+        """Test inner context adds to the outer one and is undone on exit."""
+        with LogContext(logger, run_id="r1"):
+            with LogContext(logger, stage="load"):
+                logger.info("inner")
+            logger.info("outer")
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert messages == ["run_id=r1 - stage=load - inner", "run_id=r1 - outer"]
+
+    def test_threads_keep_separate_context(self, logger, caplog):
+        """Test concurrent contexts in different threads don't mix."""
+        barrier = threading.Barrier(2)
+
+        def work(run_id):
+            with LogContext(logger, run_id=run_id):
+                barrier.wait()
+                logger.info("working")
+
+        threads = [threading.Thread(target=work, args=(r,)) for r in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        messages = sorted(r.getMessage() for r in caplog.records)
+        assert messages == ["run_id=a - working", "run_id=b - working"]
+
+
+class TestLoadYaml:
+    """Tests for cached YAML config loading."""
+
+    def test_parsed_once_until_modified(self, tmp_path):
+        """Test the file is re-parsed only when its mtime changes."""
+        path = tmp_path / "logging.yaml"
+        path.write_text("version: 1\n")
+        _load_yaml.cache_clear()
+
+        with patch('src.utils.logger.yaml.safe_load', return_value={"version": 1}) as mock_load:
+            _load_yaml(str(path), path.stat().st_mtime)
+            _load_yaml(str(path), path.stat().st_mtime)
+            assert mock_load.call_count == 1
+
+            stat = path.stat()
+            os.utime(path, (stat.st_atime, stat.st_mtime + 1))
+            _load_yaml(str(path), path.stat().st_mtime)
+            assert mock_load.call_count == 2
+
+        _load_yaml.cache_clear()
+
+
+class TestConfigureOnce:
+    """Tests for lazy one-time logging setup."""
+
+    @patch('src.utils.logger.setup_logging')
+    def test_configures_only_once(self, mock_setup):
+        """Test repeated calls and get_logger() configure a single time."""
+        with patch('src.utils.logger._CONFIGURED', False):
+            configure_once()
+            configure_once()
+            get_logger("tests.unit.configure")
+
+        mock_setup.assert_called_once()
+
+
+class TestGetLogger:
+    """Tests for the get_logger entry point."""
+
+    def test_returns_configured_logger(self, caplog):
+        """Test logging is configured on first use and messages are emitted."""
+        caplog.set_level(logging.INFO)
+
+        logger = get_logger("tests.unit.getlogger")
+        logger.info("Logger initialized successfully")
+
+        assert logger.name == "tests.unit.getlogger"
+        assert logger_module._CONFIGURED
+        assert [r.getMessage() for r in caplog.records] == ["Logger initialized successfully"]
+
+
+class TestSetupLogging:
+    """Tests for log level overrides."""
+
+    @pytest.fixture(autouse=True)
+    def restore_config(self):
+        """Reapply the default config after each test."""
+        yield
+        setup_logging()
+
+    def test_level_applies_to_pipeline_loggers(self):
+        """Test the override reaches 'src', which doesn't propagate to root."""
+        setup_logging(log_level="warning")
+
+        src_logger = logging.getLogger("src")
+        assert src_logger.level == logging.WARNING
+        assert not src_logger.isEnabledFor(logging.INFO)
+
+    @patch('src.utils.logger.logging.warning')
+    def test_unknown_level_ignored(self, mock_warning):
+        """Test a bad level name warns instead of raising."""
+        setup_logging(log_level="verbose")
+
+        assert logging.getLogger("src").level == logging.DEBUG
+        mock_warning.assert_called_once_with("Ignoring unknown log level 'verbose'")
+
+    @patch('src.utils.logger.logging.warning')
+    def test_unknown_level_with_basic_fallback(self, mock_warning, tmp_path):
+        """Test a bad level name doesn't break the fallback config either."""
+        setup_logging(config_path=tmp_path / "missing.yaml", log_level="verbose")
+
+        assert logging.getLogger().level == logging.INFO
+        mock_warning.assert_called_with("Ignoring unknown log level 'verbose'")
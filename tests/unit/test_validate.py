@@ -0,0 +1,226 @@
+"""Unit tests for trip record validation."""
+from datetime import datetime
+
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from pydantic import ValidationError
+
+from src.validate.jit import REJECT_REASONS, validate_table
+from src.validate.parquet import split_parquet
+from src.validate.schemas import TripRecord, TripRecordFast
+from src.validate.vectorized import validate_batch
+from tests.helpers import make_trip
+
+
+TRIPS = [
+    make_trip(),
+    make_trip(vendorid=3),
+    make_trip(passenger_count=None),
+    make_trip(trip_distance=501.0),
+    make_trip(pulocationid=0),
+    make_trip(fare_amount=-1.0),
+    make_trip(tpep_dropoff_datetime=datetime(2024, 1, 1, 9, 0)),
+    make_trip(tpep_dropoff_datetime=datetime(2024, 1, 1, 10, 0)),
+    make_trip(passenger_count=1.5),
+    make_trip(total_amount=-5.0),
+    make_trip(total_amount=float("nan")),
+    make_trip(fare_amount=float("inf")),
+    make_trip(fare_amount=float("nan")),
+    make_trip(trip_distance=float("inf")),
+]
+
+
+def _pydantic_accepts(trip: dict) -> bool:
+    try:
+        TripRecord(**trip)
+        return True
+    except ValidationError:
+        return False
+
+
+@pytest.fixture
+def trips_df():
+    """Batch of trips as parquet would load them (nullable floats for ints)."""
+    return pd.DataFrame(TRIPS)
+
+
+@pytest.fixture
+def trips_table():
+    """Batch of trips as Arrow, with NaN kept apart from null."""
+    return pa.Table.from_pylist(TRIPS)
+
+
+class TestValidateBatch:
+    """Tests for the vectorized pandas validator."""
+
+    def test_split_matches_trip_record(self, trips_df):
+        """Test each row is accepted exactly when TripRecord accepts it."""
+        valid, rejected = validate_batch(trips_df)
+
+        expected = [i for i, trip in enumerate(TRIPS) if _pydantic_accepts(trip)]
+        assert list(valid.index) == expected
+        assert sorted([*valid.index, *rejected.index]) == list(range(len(TRIPS)))
+
+    def test_parses_string_timestamps(self, trips_df):
+        """Test timestamp columns given as strings are parsed."""
+        trips_df["tpep_pickup_datetime"] = trips_df["tpep_pickup_datetime"].astype(str)
+        trips_df["tpep_dropoff_datetime"] = trips_df["tpep_dropoff_datetime"].astype(str)
+
+        valid, rejected = validate_batch(trips_df)
+
+        assert 0 in valid.index
+        assert 6 in rejected.index
+
+    def test_mixed_case_columns(self, trips_df):
+        """Test TLC's mixed-case column names are matched like lowercase ones."""
+        tlc_df = trips_df.rename(columns={
+            "vendorid": "VendorID",
+            "ratecodeid": "RatecodeID",
+            "pulocationid": "PULocationID",
+            "dolocationid": "DOLocationID",
+        })
+
+        valid, rejected = validate_batch(tlc_df)
+        expected_valid, expected_rejected = validate_batch(trips_df)
+
+        assert "vendorid" in valid.columns
+        assert list(valid.index) == list(expected_valid.index)
+        assert list(rejected.index) == list(expected_rejected.index)
+
+    def test_nullable_integer_columns(self, trips_df):
+        """Test <NA> in nullable integer columns is rejected, not raised."""
+        trips_df = trips_df.iloc[[0, 2]].reset_index(drop=True)
+        trips_df["passenger_count"] = trips_df["passenger_count"].astype("Int64")
+
+        valid, rejected = validate_batch(trips_df)
+
+        assert list(valid.index) == [0]
+        assert list(rejected.index) == [1]
+
+
+class TestTripRecord:
+    """Tests for the Pydantic trip schema."""
+
+    def test_accepts_valid_record(self):
+        """Test a well-formed trip validates."""
+        TripRecord(**make_trip())
+
+    def test_rejects_dropoff_before_pickup(self):
+        """Test the dropoff-after-pickup rule."""
+        with pytest.raises(ValidationError, match="Dropoff must be after pickup"):
+            TripRecord(**make_trip(
+                tpep_pickup_datetime=datetime(2024, 1, 1, 10, 30),
+                tpep_dropoff_datetime=datetime(2024, 1, 1, 10, 0),  # Before pickup!
+            ))
+
+
+class TestTripRecordFast:
+    """Tests for the dataclass row validator."""
+
+    @pytest.mark.parametrize("trip", TRIPS)
+    def test_matches_trip_record(self, trip):
+        """Test a row is accepted exactly when TripRecord accepts it."""
+        try:
+            TripRecordFast(**trip)
+            accepted = True
+        except ValueError:
+            accepted = False
+
+        assert accepted == _pydantic_accepts(trip)
+
+    def test_frozen_and_slotted(self):
+        """Test records are immutable and carry no __dict__."""
+        trip = TripRecordFast(**make_trip())
+
+        assert not hasattr(trip, "__dict__")
+        with pytest.raises(AttributeError):
+            trip.vendorid = 2
+
+
+class TestSplitParquet:
+    """Tests for the Polars parquet validator."""
+
+    def test_split_matches_trip_record(self, trips_table, tmp_path):
+        """Test a row is kept exactly when TripRecord accepts it."""
+        path = tmp_path / "trips.parquet"
+        # TLC files use mixed-case column names
+        pq.write_table(trips_table.rename_columns(
+            ["VendorID", *trips_table.column_names[1:]]
+        ), path)
+
+        valid_path, rejected_path = split_parquet(path, tmp_path / "staging", tmp_path / "rejected")
+        valid = pl.read_parquet(valid_path)
+        rejected = pl.read_parquet(rejected_path)
+        accepted = [trip for trip in TRIPS if _pydantic_accepts(trip)]
+
+        assert "vendorid" in valid.columns and "vendorid" in rejected.columns
+        assert valid["fare_amount"].to_list() == [trip["fare_amount"] for trip in accepted]
+        assert len(rejected) == len(TRIPS) - len(accepted)
+        assert rejected_path.parent == tmp_path / "rejected"
+
+    def test_nan_only_fails_bounds(self, tmp_path):
+        """Test NaN is rejected in a bounded column but kept in an unbounded one."""
+        path = tmp_path / "trips.parquet"
+        pq.write_table(pa.Table.from_pylist([
+            make_trip(fare_amount=float("nan")),
+            make_trip(total_amount=float("nan")),
+            make_trip(total_amount=None),
+        ]), path)
+
+        valid_path, rejected_path = split_parquet(path, tmp_path / "staging", tmp_path / "rejected")
+
+        assert len(pl.read_parquet(valid_path)) == 1
+        assert len(pl.read_parquet(rejected_path)) == 2
+
+
+class TestValidateTable:
+    """Tests for the Numba-compiled validator."""
+
+    def test_matches_trip_record(self, trips_table):
+        """Test a row is valid exactly when TripRecord accepts it."""
+        codes = validate_table(trips_table)
+
+        assert [code == 0 for code in codes] == [_pydantic_accepts(t) for t in TRIPS]
+
+    def test_reject_reasons(self, trips_table):
+        """Test codes name the first rule each row broke."""
+        codes = validate_table(trips_table)
+
+        assert REJECT_REASONS[codes[1]] == "vendorid"
+        assert REJECT_REASONS[codes[3]] == "trip_distance"
+        assert REJECT_REASONS[codes[6]] == "tpep_dropoff_datetime"
+
+    def test_null_timestamp_rejected(self, trips_df):
+        """Test a missing pickup time is rejected, not compared as a number."""
+        trips_df.loc[0, "tpep_pickup_datetime"] = pd.NaT
+
+        codes = validate_table(pa.Table.from_pandas(trips_df))
+
+        assert REJECT_REASONS[codes[0]] == "tpep_dropoff_datetime"
+
+    def test_null_unbounded_rejected(self):
+        """Test a null is rejected where NaN would be kept (no bounds to fail)."""
+        table = pa.Table.from_pylist([
+            make_trip(total_amount=float("nan")),
+            make_trip(total_amount=None),
+        ])
+
+        codes = validate_table(table)
+
+        assert codes[0] == 0
+        assert REJECT_REASONS[codes[1]] == "total_amount"
+
+    def test_chunked_table(self, trips_table):
+        """Test multi-chunk columns give the same codes as a single chunk."""
+        chunked = pa.concat_tables([trips_table.slice(0, 4), trips_table.slice(4)])
+
+        assert list(validate_table(chunked)) == list(validate_table(trips_table))
+
+    def test_empty_table(self, trips_df):
+        """Test an empty batch returns no codes."""
+        codes = validate_table(pa.Table.from_pandas(trips_df.iloc[:0]))
+
+        assert len(codes) == 0